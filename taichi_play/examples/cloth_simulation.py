@@ -102,7 +102,7 @@ def run():
         for i in ti.grouped(x):
             v[i] *= ti.exp(-drag_damping * dt)
             offset_to_center = x[i] - ball_center[0]
-            if offset_to_center.norm() <= ball_radius:
+            if offset_to_center.norm_sqr() <= ball_radius**2:
                 # Velocity projection
                 normal = offset_to_center.normalized()
                 v[i] -= min(v[i].dot(normal), 0) * normal
@@ -17,11 +17,12 @@ def run():
 
     @ti.kernel
     def paint(t: float):
+        c = tm.vec2(-0.8, tm.cos(t) * 0.2)  # Same for every pixel, computed once
+        scale = 2.0 / n
         for i, j in pixels:  # Parallelized over all pixels
-            c = tm.vec2(-0.8, tm.cos(t) * 0.2)
-            z = tm.vec2(i / n - 1, j / n - 0.5) * 2
+            z = tm.vec2(i * scale - 2.0, j * scale - 1.0)
             iterations = 0
-            while z.norm() < 20 and iterations < 50:
+            while z.dot(z) < 400 and iterations < 50:  # |z| < 20 without a sqrt
                 z = complex_sqr(z) + c
                 iterations += 1
             pixels[i, j] = 1 - iterations * 0.02
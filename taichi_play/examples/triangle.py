@@ -54,12 +54,17 @@ def run():
     swap_button = QPushButton("Swap Colors")
     layout.addWidget(swap_button)
 
-    def swap_colors():
-        """Rotate the vertex colors around."""
-        temp = [colors[0][0], colors[0][1], colors[0][2]]
+    @ti.kernel
+    def rotate_colors():
+        # Single launch instead of one per Python-side field access
+        temp = colors[0]
         colors[0] = colors[1]
         colors[1] = colors[2]
         colors[2] = temp
+
+    def swap_colors():
+        """Rotate the vertex colors around."""
+        rotate_colors()
         print("Colors swapped!")
 
     swap_button.clicked.connect(swap_colors)